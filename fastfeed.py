@@ -0,0 +1,252 @@
+"""
+轻量 RSS/Atom 解析
+
+先根据文档开头判断源类型，常见的 RSS 2.0 / RSS 1.0 (RDF) / Atom 源直接用 ElementTree 增量解析，
+只提取格式化器用到的字段；无法识别或解析失败时返回 None，由调用方回退到 feedparser。
+
+返回结构与 feedparser 保持一致（feed.feed / feed.entries / feed.bozo，
+entry 为 dict，字段名相同），formatters.py 中的规则无需区分来源。
+"""
+
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from functools import partial
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_RDF = "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}"
+_RSS1 = "{http://purl.org/rss/1.0/}"
+_DC = "{http://purl.org/dc/elements/1.1/}"
+_CONTENT = "{http://purl.org/rss/1.0/modules/content/}"
+
+# 只在文档开头查找根元素
+_SNIFF_LEN = 512
+
+
+@dataclass
+class ParsedFeed:
+    """解析结果（feedparser 结果的最小子集）"""
+    feed: dict = field(default_factory=dict)
+    entries: list[dict] = field(default_factory=list)
+    bozo: bool = False
+    # HTTP 缓存校验值，由拉取方填写
+    etag: str = ""
+    modified: str = ""
+
+
+def sniff_feed_type(raw: bytes) -> str:
+    """根据开头字节判断源类型，返回 rss / rdf / atom，未知返回空串"""
+    head = raw[:_SNIFF_LEN]
+    if b"<rss" in head:
+        return "rss"
+    if b"<rdf:RDF" in head:
+        return "rdf"
+    if b"<feed" in head:
+        return "atom"
+    return ""
+
+
+def _parse_date(text: str) -> time.struct_time | None:
+    """解析 RFC 822（RSS）或 ISO 8601（Atom）时间，返回 UTC struct_time
+
+    标准库解析不了或时区无法识别（如 +08:00 写法）时交给 feedparser 的日期解析
+    """
+    text = text.strip()
+    if not text:
+        return None
+    try:
+        dt = parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        dt = None
+    if dt is None:
+        try:
+            dt = datetime.fromisoformat(text.replace("Z", "+00:00"))
+        except ValueError:
+            dt = None
+        else:
+            # ISO 8601 不带时区时按 UTC 处理（与 feedparser 一致）
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=timezone.utc)
+    if dt is None or dt.tzinfo is None:
+        # feedparser 导入较慢，只在标准库处理不了时才导入
+        from feedparser.datetimes import _parse_date as _fp_parse_date
+        return _fp_parse_date(text)
+    return dt.utctimetuple()
+
+
+def _set_date(entry: dict, key: str, text: str):
+    parsed = _parse_date(text)
+    entry[key] = text.strip()
+    if parsed:
+        entry[key + "_parsed"] = parsed
+
+
+def _text(elem) -> str:
+    return "".join(elem.itertext()).strip()
+
+
+def _rss_entry(item, ns: str = "") -> dict:
+    """RSS 2.0 条目（无命名空间）；RSS 1.0 传入 ns=_RSS1"""
+    entry: dict = {}
+    content = ""
+    guid_is_link = False
+    for child in item:
+        tag = child.tag
+        if tag == ns + "title":
+            entry["title"] = _text(child)
+        elif tag == ns + "link":
+            entry["link"] = _text(child)
+        elif tag == "guid":
+            entry["id"] = _text(child)
+            guid_is_link = child.get("isPermaLink", "true").lower() == "true"
+        elif tag == ns + "description":
+            entry["description"] = entry["summary"] = _text(child)
+        elif tag == _CONTENT + "encoded":
+            content = _text(child)
+        elif tag == "enclosure":
+            entry.setdefault("enclosures", []).append({
+                "href": child.get("url", ""),
+                "type": child.get("type", ""),
+                "length": child.get("length", ""),
+            })
+        elif tag == "pubDate":
+            _set_date(entry, "published", child.text or "")
+        elif tag == _DC + "date":
+            _set_date(entry, "updated", child.text or "")
+    # 与 feedparser 一致：没有 description 时用 content:encoded，没有 link 时用永久链接 guid
+    if "description" not in entry and content:
+        entry["description"] = entry["summary"] = content
+    if "link" not in entry and guid_is_link and entry.get("id"):
+        entry["link"] = entry["id"]
+    return entry
+
+
+def _atom_entry(item) -> dict:
+    entry: dict = {}
+    content = ""
+    for child in item:
+        tag = child.tag
+        if tag == _ATOM + "title":
+            entry["title"] = _text(child)
+        elif tag == _ATOM + "link":
+            rel = child.get("rel", "alternate")
+            href = child.get("href", "")
+            if rel == "alternate" and "link" not in entry:
+                entry["link"] = href
+            elif rel == "enclosure":
+                entry.setdefault("enclosures", []).append({
+                    "href": href,
+                    "type": child.get("type", ""),
+                    "length": child.get("length", ""),
+                })
+        elif tag == _ATOM + "id":
+            entry["id"] = _text(child)
+        elif tag == _ATOM + "summary":
+            entry["description"] = entry["summary"] = _text(child)
+        elif tag == _ATOM + "content":
+            content = _text(child)
+        elif tag == _ATOM + "published":
+            _set_date(entry, "published", child.text or "")
+        elif tag == _ATOM + "updated":
+            _set_date(entry, "updated", child.text or "")
+    if "description" not in entry and content:
+        entry["description"] = entry["summary"] = content
+    return entry
+
+
+# 源类型 -> (频道标题路径, 条目标签, 条目解析函数)
+_LAYOUTS = {
+    "rss": (("rss", "channel", "title"), "item", _rss_entry),
+    "rdf": ((_RDF + "RDF", _RSS1 + "channel", _RSS1 + "title"), _RSS1 + "item",
+            partial(_rss_entry, ns=_RSS1)),
+    "atom": ((_ATOM + "feed", _ATOM + "title"), _ATOM + "entry", _atom_entry),
+}
+
+
+class FeedStreamParser:
+    """增量解析器：边下载边解析，每个条目提取字段后立即释放
+
+    用法：循环 feed(chunk)，返回 True 表示已达到 limit 可停止读取；
+    最后 close() 取结果，返回 None 表示需回退到 feedparser。
+    """
+
+    def __init__(self, limit: int = 0):
+        self.limit = limit
+        self.result = ParsedFeed()
+        self._head = b""
+        self._parser: ET.XMLPullParser | None = None
+        self._layout = None
+        # 当前打开的元素及其标签路径
+        self._stack: list[ET.Element] = []
+        self._path: list[str] = []
+        self._failed = False
+        self._done = False
+
+    def _start(self):
+        kind = sniff_feed_type(self._head)
+        if not kind:
+            self._failed = True
+            return
+        self._layout = _LAYOUTS[kind]
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+
+    def _drain(self):
+        title_path, entry_tag, parse_item = self._layout
+        for event, elem in self._parser.read_events():
+            if event == "start":
+                self._stack.append(elem)
+                self._path.append(elem.tag)
+                continue
+            self._stack.pop()
+            if elem.tag == entry_tag:
+                self.result.entries.append(parse_item(elem))
+                # 从父元素摘除，已解析的条目不再占用内存
+                if self._stack:
+                    self._stack[-1].remove(elem)
+                elem.clear()
+                if self.limit and len(self.result.entries) >= self.limit:
+                    self._done = True
+                    return
+            elif tuple(self._path) == title_path:
+                self.result.feed["title"] = _text(elem)
+            self._path.pop()
+
+    def feed(self, chunk: bytes) -> bool:
+        """喂入一段数据，返回是否已可以停止读取"""
+        if self._failed or self._done:
+            return self._done
+        if self._parser is None:
+            self._head += chunk
+            if len(self._head) < _SNIFF_LEN:
+                return False
+            self._start()
+            if self._failed:
+                return False
+            chunk, self._head = self._head, b""
+        try:
+            self._parser.feed(chunk)
+            self._drain()
+        except (ET.ParseError, ValueError, LookupError):
+            self._failed = True
+        return self._done
+
+    def close(self) -> ParsedFeed | None:
+        """结束解析，返回结果；无法识别或解析失败返回 None"""
+        if self._parser is None and not self._failed:
+            # 文档不足 _SNIFF_LEN 字节
+            self._start()
+            if not self._failed:
+                self.feed(self._head)
+        if self._failed:
+            return None
+        if not self._done:
+            try:
+                self._parser.close()
+                self._drain()
+            except (ET.ParseError, ValueError, LookupError):
+                return None
+        return self.result
+
@@ -14,10 +14,28 @@
 
 import re
 import time
+import calendar
+from functools import lru_cache
 from html import unescape
 from dataclasses import dataclass
 from urllib.parse import urlparse, parse_qs, unquote
 
+# 可选依赖：安装 selectolax 或 lxml 后，长 HTML 描述走 C 实现的解析器（优先 selectolax）
+try:
+    from selectolax.parser import HTMLParser as _SelectolaxParser
+except ImportError:
+    _SelectolaxParser = None
+
+try:
+    from lxml import html as _lxml_html
+except ImportError:
+    _lxml_html = None
+
+
+_TAG_RE = re.compile(r'<[^>]+>')
+# 短文本用正则更快，超过此长度才交给 HTML 解析器
+_PARSER_MIN_LEN = 256
+
 
 @dataclass
 class RSSItem:
@@ -31,12 +49,37 @@ class RSSItem:
     extra: str = ""
 
 
+@lru_cache(maxsize=512)
+def _fmt_ts(ts: int) -> str:
+    """时间戳格式化为本地时间字符串（同一 feed 中常有相同时间戳，按值缓存）"""
+    t = time.localtime(ts)
+    return (f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d} "
+            f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}")
+
+
+def _parse_html_text(text: str) -> str:
+    """用可用的 HTML 解析器提取文本，均不可用或解析失败时退回正则"""
+    try:
+        if _SelectolaxParser is not None:
+            return _SelectolaxParser(text).text(separator="", strip=False)
+        if _lxml_html is not None:
+            return _lxml_html.fromstring(text).text_content()
+    except Exception:
+        pass
+    return _TAG_RE.sub('', text)
+
+
 def strip_html(text: str) -> str:
     """去除 HTML 标签和多余空白，返回纯文本"""
     if not text:
         return ""
     text = unescape(text)
-    text = re.sub(r'<[^>]+>', '', text)
+    # 不含标签的文本（纯文本描述很常见）跳过标签处理
+    if '<' in text:
+        if len(text) > _PARSER_MIN_LEN:
+            text = _parse_html_text(text)
+        else:
+            text = _TAG_RE.sub('', text)
     # 去掉只含空白的行，合并连续换行
     lines = [line.strip() for line in text.splitlines() if line.strip()]
     return "\n".join(lines)
@@ -61,14 +104,22 @@ class DefaultFormatter:
             "extra": "",
         }
 
-    def parse_entry(self, entry, chan_title: str, desc_max_len: int = 200) -> RSSItem:
-        """完整解析一条 entry 为 RSSItem（一般不需要重写）"""
-        fields = self._extract_fields(entry)
+    def parse_timestamp(self, entry) -> int:
+        """只解析发布时间戳（无时间返回 0），用于在完整解析前判断是否为新条目
 
-        # 时间解析
+        *_parsed 是 UTC 时间，用 calendar.timegm 转换（time.mktime 会当作本地时间）
+        """
         pub_parsed = entry.get("published_parsed") or entry.get("updated_parsed")
-        pub_ts = int(time.mktime(pub_parsed)) if pub_parsed else 0
-        pub_date = time.strftime("%Y-%m-%d %H:%M:%S", pub_parsed) if pub_parsed else ""
+        return calendar.timegm(pub_parsed) if pub_parsed else 0
+
+    def parse_entry_light(self, entry) -> tuple[int, dict]:
+        """轻量解析：只取时间戳和原始字段，不做 HTML 清理和时间格式化"""
+        return self.parse_timestamp(entry), self._extract_fields(entry)
+
+    def parse_entry_full(self, fields: dict, pub_ts: int, chan_title: str,
+                         desc_max_len: int = 200) -> RSSItem:
+        """由轻量解析的结果生成 RSSItem，只对需要推送的条目调用"""
+        pub_date = _fmt_ts(pub_ts) if pub_ts else ""
 
         # 描述处理
         desc = strip_html(fields["description"])
@@ -85,15 +136,25 @@ class DefaultFormatter:
             extra=fields.get("extra", ""),
         )
 
+    def parse_entry(self, entry, chan_title: str, desc_max_len: int = 200) -> RSSItem:
+        """完整解析一条 entry 为 RSSItem（一般不需要重写）"""
+        pub_ts, fields = self.parse_entry_light(entry)
+        return self.parse_entry_full(fields, pub_ts, chan_title, desc_max_len)
 
-def _get_url_param(url: str, key: str) -> str:
-    """从 URL 中提取指定查询参数"""
+
+@lru_cache(maxsize=256)
+def _query_params(url: str) -> dict[str, list[str]]:
+    """解析 URL 查询参数（按 URL 缓存，同一订阅只解析一次）"""
     try:
-        params = parse_qs(urlparse(url).query)
-        values = params.get(key, [])
-        return values[0] if values else ""
+        return parse_qs(urlparse(url).query)
     except Exception:
-        return ""
+        return {}
+
+
+def _get_url_param(url: str, key: str) -> str:
+    """从 URL 中提取指定查询参数"""
+    values = _query_params(url).get(key, [])
+    return values[0] if values else ""
 
 
 # ==================== 自定义网站规则 ====================
@@ -173,15 +234,29 @@ FORMATTERS: dict[str, type[DefaultFormatter]] = {
 }
 
 _default = DefaultFormatter()
+# 格式化器无状态，每个类只实例化一次
+_instances: dict[type[DefaultFormatter], DefaultFormatter] = {DefaultFormatter: _default}
+
+
+def _get_instance(cls: type[DefaultFormatter]) -> DefaultFormatter:
+    if cls not in _instances:
+        _instances[cls] = cls()
+    return _instances[cls]
+
+
+# 所有注册域名合成一个正则：域名本身或其子域名，一次匹配即可定位
+_DOMAIN_RE = re.compile(
+    r'(?:^|\.)(' + '|'.join(map(re.escape, FORMATTERS)) + r')$'
+)
 
 
+@lru_cache(maxsize=256)
 def get_formatter(url: str) -> DefaultFormatter:
-    """根据 URL 域名获取对应的格式化器，未匹配则返回默认"""
+    """根据 URL 域名获取对应的格式化器，未匹配则返回默认（按 URL 缓存）"""
     try:
-        domain = urlparse(url).netloc.lower()
-        for key, cls in FORMATTERS.items():
-            if domain == key or domain.endswith("." + key):
-                return cls()
+        m = _DOMAIN_RE.search(urlparse(url).netloc.lower())
+        if m:
+            return _get_instance(FORMATTERS[m.group(1)])
     except Exception:
         pass
     return _default
@@ -1,12 +1,20 @@
 import os
 import json
+import asyncio
+import functools
+import hashlib
 import re
 import time
+from urllib.parse import urlsplit
 import aiohttp
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
-import feedparser
+try:
+    # 可选依赖：安装 orjson 后用它读写数据文件
+    import orjson
+except ImportError:
+    orjson = None
 
 from astrbot.api.event import filter, AstrMessageEvent, MessageChain
 from astrbot.api.star import Context, Star, register
@@ -15,21 +23,38 @@ import astrbot.api.message_components as Comp
 
 
 from .formatters import RSSItem, get_formatter
+from .fastfeed import FeedStreamParser
 
 
 DATA_FILE = "/data/astrbot_plugin_myrss_data.json"
+# 数据改动后延迟写盘的秒数，期间的多次改动合并为一次写入
+SAVE_DELAY = 0.5
+# 定期检查并落盘未保存改动的间隔（秒）
+FLUSH_INTERVAL = 30
+# 流式读取响应的分块大小
+CHUNK_SIZE = 64 * 1024
+# /rss add 验证订阅源的等待上限（秒），避免指令长时间无响应
+ADD_TIMEOUT = 10
+# 一次定时触发中同时拉取的订阅源数量上限
+MAX_CONCURRENT_POLLS = 16
+# 同一主机同时进行的请求数上限，避免并发拉取时触发对方限流
+HOST_CONCURRENCY = 2
+# 完整拉取结果的复用时长（秒）：不同定时规则订阅了同一源时，相近时刻只请求一次
+FETCH_CACHE_TTL = 30
+HEADERS = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
+# 条件请求返回 304 时 _fetch_feed 的返回值：源未变化，无需解析
+NOT_MODIFIED = object()
+
+
+# metadata.yaml 的 key: value 行，注释行不匹配；值两侧的引号在读取时去掉
+_META_RE = re.compile(r'^(?!#)([A-Za-z_]\w*)[ \t]*:[ \t]*(.*?)[ \t]*$', re.MULTILINE)
 
 
 def _load_metadata() -> dict:
     """读取 metadata.yaml"""
-    meta = {}
     path = os.path.join(os.path.dirname(__file__), "metadata.yaml")
     with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            if ":" in line and not line.startswith("#"):
-                key, _, value = line.partition(":")
-                meta[key.strip()] = value.strip().strip('"')
-    return meta
+        return {key: value.strip('"') for key, value in _META_RE.findall(f.read())}
 
 
 _meta = _load_metadata()
@@ -42,21 +67,55 @@ class MyRSSPlugin(Star):
         self.context = context
         self.config = config
         self.data: dict = self._load_data()
+        # 用户 -> 订阅 URL 列表（顺序与 self.data 一致，即 /rss list 的索引顺序）
+        self._by_user: dict[str, list[str]] = {}
+        for url, info in self.data.items():
+            for user in info.get("subscribers", {}):
+                self._by_user.setdefault(user, []).append(url)
+        # 数据有改动时才写盘，写盘经 _schedule_save 延迟合并
+        self._dirty = False
+        self._save_task: asyncio.Task | None = None
+        # 上次写盘内容的摘要，内容未变时跳过写入
+        self._last_digest: bytes | None = None
         self.scheduler = AsyncIOScheduler()
+        # 共享的 HTTP 会话（复用连接池），在 initialize 中创建
+        self._session: aiohttp.ClientSession | None = None
+        # 限制定时任务中同时拉取的订阅源数量
+        self._poll_sem = asyncio.Semaphore(MAX_CONCURRENT_POLLS)
+        # 每个主机一个信号量，限制对同一主机的并发请求
+        self._host_sems: dict[str, asyncio.Semaphore] = {}
+        # 进行中的拉取任务，同一 URL 的并发请求共用一次结果
+        self._inflight: dict[tuple, asyncio.Future] = {}
+        # url -> (拉取时间, 完整解析结果)
+        self._fetch_cache: dict[str, tuple[float, object]] = {}
+        # 正在处理的 (url, user)，避免上一轮未结束时重复推送
+        self._running: set[tuple[str, str]] = set()
 
         # 从插件设置读取配置
         self.max_items = config.get("max_items_per_poll", 3)
         self.desc_max_len = config.get("description_max_length", 200)
         self.default_cron = config.get("default_cron", "0.18.*.*.*")
         self.default_filter = config.get("default_filter", "")
+        self.assume_sorted = config.get("assume_sorted", True)
 
     async def initialize(self):
+        self._get_session()
         self.scheduler.start()
+        # 兜底定期落盘：写盘失败后没有新改动时也会重试
+        self.scheduler.add_job(
+            self._flush_if_dirty, "interval", seconds=FLUSH_INTERVAL, id="flush",
+        )
         self._refresh_scheduler()
         logger.info("MyRSS 插件初始化完成")
 
     async def terminate(self):
         self.scheduler.shutdown(wait=False)
+        # 等待进行中的写盘结束，再落盘剩余改动
+        if self._save_task and not self._save_task.done():
+            await self._save_task
+        self._save_data()
+        if self._session and not self._session.closed:
+            await self._session.close()
         logger.info("MyRSS 插件已停止")
 
     # ==================== 数据持久化 ====================
@@ -64,141 +123,393 @@ class MyRSSPlugin(Star):
     def _load_data(self) -> dict:
         if os.path.exists(DATA_FILE):
             try:
-                with open(DATA_FILE, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
+                with open(DATA_FILE, "rb") as f:
+                    raw = f.read()
+                return orjson.loads(raw) if orjson is not None else json.loads(raw)
+            except (ValueError, IOError):
                 logger.error("RSS: 数据文件损坏，使用空数据")
         return {}
 
-    def _save_data(self):
+    async def _flush_if_dirty(self):
+        self._schedule_save()
+
+    def _schedule_save(self):
+        """数据有改动时安排一次延迟写盘，已有待执行的写盘则合并"""
+        if not self._dirty:
+            return
+        if self._save_task is None or self._save_task.done():
+            self._save_task = asyncio.create_task(self._flush_after(SAVE_DELAY))
+
+    async def _flush_after(self, delay: float):
+        """延迟后写盘；序列化在事件循环内完成，文件写入放到线程池"""
+        await asyncio.sleep(delay)
+        # 写盘期间产生的新改动在本任务内继续写，不会遗漏
+        while self._dirty:
+            payload = self._dump_data()
+            self._dirty = False
+            digest = self._digest(payload)
+            if digest == self._last_digest:
+                continue
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, self._write_data, payload)
+                self._last_digest = digest
+            except OSError as e:
+                self._dirty = True
+                logger.error(f"RSS: 保存数据失败: {e}")
+                return
+
+    @staticmethod
+    def _digest(payload: bytes) -> bytes:
+        return hashlib.blake2b(payload, digest_size=16).digest()
+
+    def _dump_data(self) -> bytes:
+        """序列化为紧凑 JSON（文件由程序读写，不需要缩进）"""
+        if orjson is not None:
+            return orjson.dumps(self.data)
+        return json.dumps(self.data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    @staticmethod
+    def _write_data(payload: bytes):
+        """先写临时文件并 fsync 再替换，断电或崩溃时也不会留下写一半的文件"""
         os.makedirs(os.path.dirname(DATA_FILE), exist_ok=True)
-        with open(DATA_FILE, "w", encoding="utf-8") as f:
-            json.dump(self.data, f, indent=2, ensure_ascii=False)
+        tmp = DATA_FILE + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, DATA_FILE)
+
+    def _save_data(self):
+        """数据有改动（_dirty）时立即同步写盘（用于退出时）"""
+        if not self._dirty:
+            return
+        payload = self._dump_data()
+        digest = self._digest(payload)
+        if digest != self._last_digest:
+            self._write_data(payload)
+            self._last_digest = digest
+        self._dirty = False
 
     # ==================== 工具方法 ====================
 
     @staticmethod
-    def _parse_cron(dot_expr: str) -> dict:
-        """验证点分隔 cron（分.时.日.月.星期），返回调度器参数"""
+    @functools.lru_cache(maxsize=256)
+    def _cron_trigger(dot_expr: str) -> CronTrigger:
+        """解析点分隔 cron（分.时.日.月.星期）为 CronTrigger，无效时抛出异常
+
+        按表达式缓存，触发器无状态，可被多个任务共用
+        """
         parts = dot_expr.split(".")
         if len(parts) != 5:
             raise ValueError(f"cron 需要 5 段（分.时.日.月.星期），当前 {len(parts)} 段")
-        fields = {
-            "minute": parts[0], "hour": parts[1], "day": parts[2],
-            "month": parts[3], "day_of_week": parts[4],
-        }
-        CronTrigger(**fields)
-        return fields
+        return CronTrigger(
+            minute=parts[0], hour=parts[1], day=parts[2],
+            month=parts[3], day_of_week=parts[4],
+        )
 
     @staticmethod
-    def _filter_items(items: list[RSSItem], pattern: str) -> list[RSSItem]:
-        """按正则排除标题匹配的条目（忽略大小写）"""
+    @functools.lru_cache(maxsize=64)
+    def _compile_filter(pattern: str) -> re.Pattern | None:
+        """编译标题过滤正则（忽略大小写），为空或无效时返回 None
+
+        按 pattern 缓存，多个订阅共用同一规则时只编译一次
+        """
         if not pattern:
-            return items
+            return None
         try:
-            regex = re.compile(pattern, re.IGNORECASE)
-            return [item for item in items if not regex.search(item.title)]
+            return re.compile(pattern, re.IGNORECASE)
         except re.error:
-            return items
+            return None
 
     def _get_user_subs(self, user: str) -> list[tuple[str, dict]]:
         """获取指定用户的所有订阅 [(url, info), ...]"""
-        return [
-            (url, info) for url, info in self.data.items()
+        return [(url, self.data[url]) for url in self._by_user.get(user, [])]
+
+    def _index_user(self, user: str):
+        """按 self.data 的顺序重建某个用户的索引（新增订阅时调用）"""
+        self._by_user[user] = [
+            url for url, info in self.data.items()
             if user in info.get("subscribers", {})
         ]
 
     # ==================== RSS 拉取 ====================
 
-    async def _fetch_feed(self, url: str):
-        """异步请求并解析 RSS 源，返回 feedparser 结果或 None"""
-        headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
-        try:
-            connector = aiohttp.TCPConnector(ssl=False)
-            timeout = aiohttp.ClientTimeout(total=30, connect=10)
-            async with aiohttp.ClientSession(
-                trust_env=True, connector=connector, timeout=timeout, headers=headers
-            ) as session:
-                async with session.get(url) as resp:
-                    if resp.status != 200:
-                        logger.error(f"RSS: {url} 返回状态码 {resp.status}")
-                        return None
-                    return feedparser.parse(await resp.text())
-        except Exception as e:
-            logger.error(f"RSS: 请求 {url} 失败: {e}")
-            return None
+    def _get_session(self) -> aiohttp.ClientSession:
+        """获取共享的 HTTP 会话，不存在或已关闭时重新创建"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                trust_env=True,
+                connector=aiohttp.TCPConnector(
+                    ssl=False, limit=50, limit_per_host=4,
+                    ttl_dns_cache=300, keepalive_timeout=75,
+                ),
+                timeout=aiohttp.ClientTimeout(total=30, connect=10),
+                headers=HEADERS,
+            )
+        return self._session
+
+    async def _fetch_feed(self, url: str, limit: int = 0, etag: str = "", modified: str = ""):
+        """异步请求并解析 RSS 源，返回解析结果或 None
 
-    async def _poll_rss(self, url: str, max_items: int = 5, after_ts: int = 0) -> list[RSSItem]:
-        """拉取 RSS，返回比 after_ts 更新的条目列表"""
+        常见 RSS 2.0 / Atom 源边下载边解析，其余回退到 feedparser。
+        limit > 0 时解析到该数量的条目即停止读取。
+        传入上次的 etag / modified 时发送条件请求，源未变化返回 NOT_MODIFIED；
+        解析结果上的 etag / modified 属性记录本次响应的缓存校验值。
+        同一 URL 正在拉取时直接等待已有任务，不重复请求；
+        FETCH_CACHE_TTL 内拉取过完整内容时直接复用。
+        """
+        if not limit:
+            cached = self._fetch_cache.get(url)
+            if cached and time.monotonic() - cached[0] < FETCH_CACHE_TTL:
+                return cached[1]
+        key = (url, limit, etag, modified)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._download_feed(url, limit, etag, modified))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+            if not limit:
+                task.add_done_callback(lambda t: self._cache_feed(url, t))
+        # shield: 某个等待方被取消时不影响其他等待方
+        return await asyncio.shield(task)
+
+    def _cache_feed(self, url: str, task: asyncio.Future):
+        """记录完整拉取的结果，顺带清理已过期的缓存（304 和失败不缓存）"""
+        if task.cancelled() or task.exception() is not None:
+            return
+        feed = task.result()
+        if feed is NOT_MODIFIED or not feed:
+            return
+        now = time.monotonic()
+        self._fetch_cache = {
+            u: c for u, c in self._fetch_cache.items() if now - c[0] < FETCH_CACHE_TTL
+        }
+        self._fetch_cache[url] = (now, feed)
+
+    async def _download_feed(self, url: str, limit: int = 0, etag: str = "", modified: str = ""):
+        """实际发起请求并流式解析"""
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if modified:
+            headers["If-Modified-Since"] = modified
+        host = urlsplit(url).netloc.lower()
+        sem = self._host_sems.setdefault(host, asyncio.Semaphore(HOST_CONCURRENCY))
+        for attempt in range(2):
+            try:
+                async with sem, self._get_session().get(url, headers=headers) as resp:
+                    return await self._read_feed(url, resp, limit)
+            except aiohttp.ServerDisconnectedError as e:
+                # 连接池里的空闲连接可能已被服务端关闭，换一个连接重试一次
+                if attempt == 0:
+                    continue
+                logger.error(f"RSS: 请求 {url} 失败: {e}")
+            except Exception as e:
+                logger.error(f"RSS: 请求 {url} 失败: {e}")
+                break
+        return None
+
+    @staticmethod
+    async def _read_feed(url: str, resp: aiohttp.ClientResponse, limit: int = 0):
+        """读取响应并解析，返回解析结果、NOT_MODIFIED 或 None"""
+        if resp.status == 304:
+            return NOT_MODIFIED
+        if resp.status != 200:
+            logger.error(f"RSS: {url} 返回状态码 {resp.status}")
+            return None
+        parser = FeedStreamParser(limit)
+        # 保留原始数据，轻量解析失败时交给 feedparser
+        chunks: list[bytes] = []
+        async for chunk in resp.content.iter_chunked(CHUNK_SIZE):
+            chunks.append(chunk)
+            if parser.feed(chunk):
+                break
+        feed = parser.close()
+        if feed is None:
+            # feedparser 导入较慢，只在需要回退时才导入；
+            # 解析是纯 Python 的 CPU 计算，放到线程池避免阻塞事件循环。
+            # 带上响应头，编码只在 Content-Type 中声明的源（如 GBK）才能正确解码；
+            # feedparser 按小写键查找响应头
+            import feedparser
+            headers = {k.lower(): v for k, v in resp.headers.items()}
+            parse = functools.partial(feedparser.parse, b"".join(chunks), response_headers=headers)
+            feed = await asyncio.get_running_loop().run_in_executor(None, parse)
+        feed.etag = resp.headers.get("ETag", "")
+        feed.modified = resp.headers.get("Last-Modified", "")
+        return feed
+
+    async def _poll_rss(self, url: str, max_items: int = 5, after_ts: int = 0,
+                        pattern: str = "") -> tuple[list[RSSItem], int]:
+        """拉取 RSS，返回比 after_ts 更新、且标题未被 pattern 排除的条目及其中最大时间戳"""
         feed = await self._fetch_feed(url)
         if not feed:
-            return []
+            return [], after_ts
+        return self._select_items(url, feed, max_items, after_ts, pattern)
+
+    def _select_items(self, url: str, feed, max_items: int = 5, after_ts: int = 0,
+                      pattern: str = "") -> tuple[list[RSSItem], int]:
+        """从已拉取的 feed 中筛选条目，同一 feed 可按不同订阅者的规则多次筛选
 
+        返回 (条目列表, 最大时间戳)，无新条目时最大时间戳为 after_ts
+        """
         formatter = get_formatter(url)
         chan_title = formatter.get_chan_title(feed, url)
+        regex = self._compile_filter(pattern)
         items: list[RSSItem] = []
+        max_ts = after_ts
+        # 开启 assume_sorted 且开头几条确实是倒序时，才允许遇到旧条目提前结束
+        can_stop = self.assume_sorted and self._looks_sorted(formatter, feed.entries)
 
         for entry in feed.entries:
-            item = formatter.parse_entry(entry, chan_title, self.desc_max_len)
-            if item.pub_date_timestamp <= after_ts:
+            # 先轻量解析，旧条目不做 HTML 清理和时间格式化
+            pub_ts, fields = formatter.parse_entry_light(entry)
+            if pub_ts <= after_ts:
+                # 源按时间倒序时，遇到第一条旧条目即可结束
+                if can_stop and pub_ts:
+                    break
+                continue
+            # 标题过滤放在完整解析之前，被排除的条目不做 HTML 清理
+            if regex and regex.search(fields["title"]):
                 continue
-            items.append(item)
+            items.append(formatter.parse_entry_full(fields, pub_ts, chan_title, self.desc_max_len))
+            max_ts = max(max_ts, pub_ts)
             if len(items) >= max_items:
                 break
 
-        return items
+        return items, max_ts
+
+    @staticmethod
+    def _looks_sorted(formatter, entries, sample: int = 3) -> bool:
+        """开头几条带时间的条目是否按时间倒序（置顶旧帖等乱序源返回 False）"""
+        stamps = [ts for ts in map(formatter.parse_timestamp, entries[:sample]) if ts]
+        return all(a >= b for a, b in zip(stamps, stamps[1:]))
 
     @staticmethod
     def _format_items(items: list[RSSItem]) -> str:
         """将多条 RSS 条目格式化为一条消息（统一格式）"""
         parts = []
         for item in items:
-            text = f"[RSS] {item.chan_title}\n标题: {item.title}\n链接: {item.link}"
+            lines = [f"[RSS] {item.chan_title}", f"标题: {item.title}", f"链接: {item.link}"]
             if item.pub_date:
-                text += f"\n时间: {item.pub_date}"
+                lines.append(f"时间: {item.pub_date}")
             if item.description:
-                text += f"\n---\n{item.description}"
+                lines.append("---")
+                lines.append(item.description)
             if item.extra:
-                text += f"\n额外: {item.extra}"
-            parts.append(text)
+                lines.append(f"额外: {item.extra}")
+            parts.append("\n".join(lines))
         return "\n\n".join(parts)
 
     # ==================== 定时任务 ====================
 
     def _refresh_scheduler(self):
-        self.scheduler.remove_all_jobs()
-        for url, info in self.data.items():
-            for user, sub in info.get("subscribers", {}).items():
-                try:
-                    self.scheduler.add_job(
-                        self._cron_callback, "cron",
-                        **self._parse_cron(sub["cron_expr"]),
-                        args=[url, user],
-                    )
-                except Exception as e:
-                    logger.error(f"RSS: 添加定时任务失败 {url} -> {user}: {e}")
+        """每个定时规则只注册一个任务，同一时刻到期的订阅一起处理
+
+        任务 id 为 cron:<定时规则>，刷新时只增删有变化的任务
+        """
+        desired = {
+            f"cron:{sub['cron_expr']}": sub["cron_expr"]
+            for info in self.data.values()
+            for sub in info.get("subscribers", {}).values()
+        }
+        current = {job.id for job in self.scheduler.get_jobs() if job.id.startswith("cron:")}
+        for job_id in current - desired.keys():
+            self.scheduler.remove_job(job_id)
+        for job_id, cron_expr in desired.items():
+            if job_id in current:
+                continue
+            try:
+                self.scheduler.add_job(
+                    self._cron_callback,
+                    trigger=self._cron_trigger(cron_expr),
+                    args=[cron_expr],
+                    id=job_id,
+                    # 上一轮未结束不再叠加执行，错过的多次触发合并为一次
+                    max_instances=1, coalesce=True, misfire_grace_time=60,
+                )
+            except Exception as e:
+                logger.error(f"RSS: 添加定时任务失败 ({cron_expr}): {e}")
         logger.info(f"RSS: 已刷新定时任务，共 {len(self.scheduler.get_jobs())} 个")
 
-    async def _cron_callback(self, url: str, user: str):
-        """定时任务回调：拉取新条目，过滤后一次性推送"""
-        sub = self.data.get(url, {}).get("subscribers", {}).get(user)
-        if not sub:
+    async def _cron_callback(self, cron_expr: str):
+        """定时任务回调：按 URL 分组，各 URL 并发拉取一次，再按订阅者分别推送"""
+        groups: dict[str, list[str]] = {}
+        for url, info in self.data.items():
+            for user, sub in info.get("subscribers", {}).items():
+                if sub["cron_expr"] == cron_expr and (url, user) not in self._running:
+                    groups.setdefault(url, []).append(user)
+        if not groups:
             return
 
-        rss_items = await self._poll_rss(url, max_items=self.max_items, after_ts=sub.get("last_update", 0))
-        rss_items = self._filter_items(rss_items, sub.get("filter", ""))
-        if not rss_items:
+        running = {(url, user) for url, users in groups.items() for user in users}
+        self._running |= running
+        try:
+            results = await asyncio.gather(
+                *(self._poll_group(url, users) for url, users in groups.items()),
+                return_exceptions=True,
+            )
+        finally:
+            self._running -= running
+        for url, result in zip(groups, results):
+            if isinstance(result, Exception):
+                logger.error(f"RSS: 处理 {url} 失败: {result}")
+
+    async def _poll_group(self, url: str, users: list[str]):
+        """拉取一次 url，推送给 users 中的各订阅者"""
+        subscribers = self.data.get(url, {}).get("subscribers", {})
+        # 校验值按订阅者记录（各自的推送进度不同），组内一致时才发条件请求
+        validators = {
+            (subscribers.get(user, {}).get("etag", ""),
+             subscribers.get(user, {}).get("last_modified", ""))
+            for user in users
+        }
+        etag, modified = validators.pop() if len(validators) == 1 else ("", "")
+        async with self._poll_sem:
+            feed = await self._fetch_feed(url, etag=etag, modified=modified)
+        if feed is NOT_MODIFIED or not feed:
             return
 
-        chain = MessageChain(chain=[Comp.Plain(self._format_items(rss_items))])
-        await self.context.send_message(user, chain)
+        # 各订阅者的消息互不依赖，并发发送
+        results = await asyncio.gather(
+            *(self._push_new_items(url, user, feed) for user in users),
+            return_exceptions=True,
+        )
+        for user, result in zip(users, results):
+            if isinstance(result, Exception):
+                logger.error(f"RSS: 推送失败 {url} -> {user}: {result}")
 
-        max_ts = max(item.pub_date_timestamp for item in rss_items)
-        if max_ts > sub.get("last_update", 0):
-            sub["last_update"] = max_ts
-        sub["latest_link"] = rss_items[0].link
-        self._save_data()
-        logger.info(f"RSS: {url} 推送 {len(rss_items)} 条 -> {user}")
+    async def _push_new_items(self, url: str, user: str, feed):
+        """筛选该订阅者尚未收到的条目，过滤后一次性推送"""
+        # 拉取期间订阅可能已被删除
+        sub = self.data.get(url, {}).get("subscribers", {}).get(user)
+        if not sub:
+            return
+
+        rss_items, max_ts = self._select_items(
+            url, feed, max_items=self.max_items, after_ts=sub.get("last_update", 0),
+            pattern=sub.get("filter", ""),
+        )
+        if rss_items:
+            chain = MessageChain(chain=[Comp.Plain(self._format_items(rss_items))])
+            await self.context.send_message(user, chain)
+
+            if max_ts > sub.get("last_update", 0):
+                sub["last_update"] = max_ts
+                self._dirty = True
+            if sub.get("latest_link") != rss_items[0].link:
+                sub["latest_link"] = rss_items[0].link
+                self._dirty = True
+
+        # 本次内容已处理完才记录校验值供下次条件请求；
+        # 达到 max_items 时可能还有未推送的新条目，保留旧校验值，下次完整拉取
+        validators = (feed.etag, feed.modified)
+        complete = len(rss_items) < self.max_items
+        if complete and (sub.get("etag", ""), sub.get("last_modified", "")) != validators:
+            sub["etag"], sub["last_modified"] = validators
+            self._dirty = True
+        self._schedule_save()
+        if rss_items:
+            logger.info(f"RSS: {url} 推送 {len(rss_items)} 条 -> {user}")
 
     # ==================== 用户指令 ====================
 
@@ -231,7 +542,7 @@ class MyRSSPlugin(Star):
         # 验证 cron
         cron_expr = cron if cron else self.default_cron
         try:
-            self._parse_cron(cron_expr)
+            self._cron_trigger(cron_expr)
         except Exception as e:
             yield event.plain_result(f"定时规则无效: {e}")
             return
@@ -252,7 +563,8 @@ class MyRSSPlugin(Star):
         if existing:
             existing["cron_expr"] = cron_expr
             existing["filter"] = filter_pattern
-            self._save_data()
+            self._dirty = True
+            self._schedule_save()
             self._refresh_scheduler()
             yield event.plain_result(
                 f"已更新订阅规则!\n"
@@ -261,8 +573,11 @@ class MyRSSPlugin(Star):
             )
             return
 
-        # 新订阅：拉取并验证 RSS 源
-        feed = await self._fetch_feed(url)
+        # 新订阅：拉取并验证 RSS 源（只需要频道名和最新一条，读到第一条即停止）
+        try:
+            feed = await asyncio.wait_for(self._fetch_feed(url, limit=1), ADD_TIMEOUT)
+        except asyncio.TimeoutError:
+            feed = None
         if not feed:
             yield event.plain_result(f"无法访问该 RSS 地址: {url}")
             return
@@ -278,9 +593,7 @@ class MyRSSPlugin(Star):
         latest_ts, latest_link = int(time.time()), ""
         if feed.entries:
             entry = feed.entries[0]
-            parsed_time = entry.get("published_parsed") or entry.get("updated_parsed")
-            if parsed_time:
-                latest_ts = int(time.mktime(parsed_time))
+            latest_ts = formatter.parse_timestamp(entry) or latest_ts
             latest_link = entry.get("link", "")
 
         if url not in self.data:
@@ -288,8 +601,11 @@ class MyRSSPlugin(Star):
         self.data[url]["subscribers"][user] = {
             "cron_expr": cron_expr, "filter": filter_pattern,
             "last_update": latest_ts, "latest_link": latest_link,
+            "etag": feed.etag, "last_modified": feed.modified,
         }
-        self._save_data()
+        self._index_user(user)
+        self._dirty = True
+        self._schedule_save()
         self._refresh_scheduler()
 
         yield event.plain_result(
@@ -336,8 +652,12 @@ class MyRSSPlugin(Star):
         del self.data[url]["subscribers"][user]
         if not self.data[url]["subscribers"]:
             del self.data[url]
+        self._by_user[user].remove(url)
+        if not self._by_user[user]:
+            del self._by_user[user]
 
-        self._save_data()
+        self._dirty = True
+        self._schedule_save()
         self._refresh_scheduler()
         yield event.plain_result(f"已取消订阅: {title}")
 
@@ -356,8 +676,9 @@ class MyRSSPlugin(Star):
 
         url, info = subs[idx]
         sub = info["subscribers"][user]
-        rss_items = await self._poll_rss(url, max_items=self.max_items, after_ts=0)
-        rss_items = self._filter_items(rss_items, sub.get("filter", ""))
+        rss_items, _ = await self._poll_rss(
+            url, max_items=self.max_items, after_ts=0, pattern=sub.get("filter", ""),
+        )
         if not rss_items:
             yield event.plain_result("暂无内容。")
             return
@@ -0,0 +1,56 @@
+"""fastfeed 与 feedparser 的解析结果对比"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastfeed import FeedStreamParser  # noqa: E402
+from formatters import strip_html  # noqa: E402
+
+feedparser = pytest.importorskip("feedparser")
+
+
+def _rss(item: str) -> bytes:
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">'
+        f"<channel><title>t</title><item>{item}</item></channel></rss>"
+    ).encode("utf-8")
+
+
+def _both(raw: bytes) -> tuple[dict, dict]:
+    parser = FeedStreamParser()
+    parser.feed(raw)
+    fast = parser.close()
+    assert fast is not None
+    return fast.entries[0], feedparser.parse(raw).entries[0]
+
+
+@pytest.mark.parametrize("item", [
+    "<title>a</title><link>https://e.com/1</link>"
+    "<description>lead <b>bold</b> tail</description>",
+    "<title>a</title><link>https://e.com/1</link>"
+    "<content:encoded><![CDATA[<p>body</p>]]></content:encoded>",
+    '<title>a</title><guid isPermaLink="true">https://e.com/2</guid>',
+    '<title>a</title><guid isPermaLink="false">id-3</guid>',
+])
+def test_rss_entry_matches_feedparser(item):
+    fast, ref = _both(_rss(item))
+    assert fast.get("title") == ref.get("title")
+    assert fast.get("link", "") == ref.get("link", "")
+    assert strip_html(fast.get("description", "")) == strip_html(ref.get("description", ""))
+
+
+@pytest.mark.parametrize("date", [
+    "Tue, 10 Jun 2025 12:00:00 +0800",
+    "Tue, 10 Jun 2025 12:00:00 +08:00",
+    "Tue, 10 Jun 2025 12:00:00 GMT",
+    "2025-06-10T12:00:00+08:00",
+    "10 Jun 2025 12:00 CST",
+])
+def test_pub_date_matches_feedparser(date):
+    fast, ref = _both(_rss(f"<title>a</title><pubDate>{date}</pubDate>"))
+    assert fast.get("published_parsed") == ref.get("published_parsed")